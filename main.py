@@ -1,29 +1,47 @@
 """Main script for batch job extraction from Avature sites."""
 
-import json
+import asyncio
+import gzip
+import os
+import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
 from pathlib import Path
-from datetime import datetime
+
+import orjson
 
 from src.scraper import AvatureScraper
+from src.http_client import close_shared_session
 from src.proxy_manager import ProxyManager
 
 
 SITES_FILE = "input/retry_sites.txt"
 PROXIES_FILE = "input/proxies.txt"
-OUTPUT_FILE = "output/jobs.json"
+JOBS_SINK = "output/jobs.jsonl.gz"
 PROGRESS_FILE = "output/progress.json"
 SAVE_EVERY = 5
 BATCH_SIZE = 20
+SITE_CONCURRENCY = 8
+SINK_COMPRESSLEVEL = 3
 FINALIZE_SCRIPT = "scripts/finalize_output.py"
 
+_SUBDOMAIN_RE = re.compile(r'https?://([^./]+)')
+
+
+# (epoch second, formatted timestamp) - log() reformats at most once
+# per wall-clock second instead of on every call.
+_last_ts = [0, ""]
+
 
 def log(msg: str):
     """Print with flush for real-time output."""
-    ts = datetime.now().strftime("%H:%M:%S")
-    print(f"[{ts}] {msg}", flush=True)
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts[:] = [now, time.strftime("%H:%M:%S", time.localtime(now))]
+    print(f"[{_last_ts[1]}] {msg}", flush=True)
 
 
 def log_section(title: str):
@@ -42,68 +60,108 @@ def load_sites(filepath: str) -> list[str]:
 def load_progress() -> dict:
     """Load progress from previous run."""
     if Path(PROGRESS_FILE).exists():
-        with open(PROGRESS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {"completed": [], "jobs": [], "failed": []}
-
-
-def load_existing_jobs() -> list[dict]:
-    """Load existing jobs from output file."""
-    if Path(OUTPUT_FILE).exists():
-        with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("jobs", [])
-    return []
+        with open(PROGRESS_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    return {"completed": [], "failed": []}
+
+
+def load_seen_ids() -> set[str]:
+    """Load job_ids already appended to the JSONL sink.
+
+    A crash mid-append leaves the final gzip member without its
+    trailer; everything decoded before that point is kept and the torn
+    tail is dropped, so resume survives the failure the checkpoint
+    exists for.
+    """
+    seen = set()
+    if Path(JOBS_SINK).exists():
+        try:
+            with gzip.open(JOBS_SINK, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        job_id = orjson.loads(line).get("job_id")
+                        if job_id:
+                            seen.add(job_id)
+        except (EOFError, OSError):  # OSError covers gzip.BadGzipFile
+            log(f"Truncated tail in {JOBS_SINK}; resuming with {len(seen)} salvaged ids")
+    return seen
+
+
+def atomic_write(path: str, data: bytes):
+    """Write bytes to a temp file and rename it into place.
+
+    A crash mid-write can never leave a truncated checkpoint, and
+    concurrent readers (e.g. a dashboard tailing progress) always see
+    a complete file.
+    """
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 def save_progress(progress: dict):
     """Save current progress."""
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump(progress, f, indent=2)
-
-
-def save_jobs(jobs: list[dict], stats: dict):
-    """Save final jobs output."""
-    output = {
-        "total_jobs": len(jobs),
-        "stats": stats,
-        "jobs": jobs,
-    }
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    atomic_write(PROGRESS_FILE, orjson.dumps(progress, option=orjson.OPT_INDENT_2))
 
 
 def get_subdomain(url: str) -> str:
     """Extract subdomain from URL."""
-    return url.split("//")[1].split(".")[0]
-
-
-def main():
+    match = _SUBDOMAIN_RE.match(url)
+    return match.group(1) if match else url
+
+
+async def scrape_site(
+    site_url: str,
+    proxy_manager: ProxyManager,
+    semaphore: asyncio.Semaphore,
+    parse_pool: ProcessPoolExecutor,
+) -> tuple[str, list | None, Exception | None, float]:
+    """Scrape a single site, returning (site, jobs, error, elapsed)."""
+    async with semaphore:
+        site_start = time.time()
+        try:
+            async with AvatureScraper(
+                site_url,
+                proxy_manager=proxy_manager,
+                parse_executor=parse_pool,
+            ) as scraper:
+                jobs = await scraper.get_all_jobs()
+            return site_url, jobs, None, time.time() - site_start
+        except Exception as e:
+            return site_url, None, e, time.time() - site_start
+
+
+async def main():
     """Run batch extraction on all valid sites."""
     log_section("AVATURE SCRAPER")
-    
+
     proxy_manager = None
     if Path(PROXIES_FILE).exists():
         proxy_manager = ProxyManager(PROXIES_FILE)
         log(f"Proxies: {proxy_manager.total} loaded")
     else:
         log("Proxies: None (direct connection)")
-    
+
     sites = load_sites(SITES_FILE)
     total_sites = len(sites)
     log(f"Sites: {total_sites}")
-    
+
     progress = load_progress()
     completed = set(progress["completed"])
-    all_jobs = load_existing_jobs()
     failed = progress["failed"]
-    
+    seen_ids = load_seen_ids()
+    total_jobs_count = len(seen_ids)
+
     if completed:
         log(f"Resuming: {len(completed)} done")
-    if all_jobs:
-        log(f"Existing jobs: {len(all_jobs)}")
-    
-    pending = [s for s in sites if s not in completed]
+    if total_jobs_count:
+        log(f"Existing jobs: {total_jobs_count}")
+
+    # Consumed front-to-back; avoids rescanning `sites` on every batch.
+    pending = deque(s for s in sites if s not in completed)
     log(f"Pending: {len(pending)}")
     log("-" * 60)
 
@@ -111,112 +169,98 @@ def main():
     processed_this_run = 0
     last_batch_size = 0
 
-    while True:
-        pending = [s for s in sites if s not in completed]
-        if not pending:
-            break
-
-        batch = pending[:BATCH_SIZE]
-        last_batch_size = len(batch)
-        starting_completed = len(completed)
-        log(f"New batch: {len(batch)} sites | Remaining before batch: {len(pending)}")
-
-        for i, site_url in enumerate(batch, 1):
-            site_num = starting_completed + i
-            progress_pct = (site_num / total_sites) * 100 if total_sites else 0
-            subdomain = get_subdomain(site_url)
+    semaphore = asyncio.Semaphore(SITE_CONCURRENCY)
+    # Listing parses run here so tree traversal doesn't serialize the
+    # event loop behind the GIL.
+    parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    Path(JOBS_SINK).parent.mkdir(parents=True, exist_ok=True)
+
+    # Append-only sink: each job is written once, so checkpoints no longer
+    # rewrite the whole jobs list and total write volume stays linear.
+    # Gzip members concatenate cleanly, so appending across runs is safe;
+    # level 3 is the speed/ratio sweet spot for this workload.
+    with gzip.open(JOBS_SINK, "ab", compresslevel=SINK_COMPRESSLEVEL) as jobs_sink:
+        while pending:
+            log(f"New batch: {min(BATCH_SIZE, len(pending))} sites | Remaining before batch: {len(pending)}")
+            batch = [pending.popleft() for _ in range(min(BATCH_SIZE, len(pending)))]
+            last_batch_size = len(batch)
+
+            results = await asyncio.gather(*(
+                scrape_site(site_url, proxy_manager, semaphore, parse_pool)
+                for site_url in batch
+            ))
+
+            for site_url, jobs, error, site_time in results:
+                subdomain = get_subdomain(site_url)
+
+                if error is None:
+                    log(f"  OK   {subdomain}  jobs={len(jobs)}  time={site_time:.1f}s")
+                    for job in jobs:
+                        # Dedup at ingestion: duplicate ids are never written.
+                        if job.job_id not in seen_ids:
+                            seen_ids.add(job.job_id)
+                            jobs_sink.write(orjson.dumps(job.to_dict()) + b"\n")
+                            total_jobs_count += 1
+                else:
+                    error_msg = str(error)[:50]
+                    log(f"  FAIL {subdomain}  error={error_msg}  time={site_time:.1f}s")
+                    failed.append({"site": site_url, "error": str(error)})
 
-            log(f"[{site_num}/{total_sites} | {progress_pct:5.1f}%] {subdomain}")
-            site_start = time.time()
-
-            try:
-                with AvatureScraper(site_url, proxy_manager=proxy_manager) as scraper:
-                    jobs = scraper.get_all_jobs()
+                completed.add(site_url)
 
-                site_time = time.time() - site_start
-                log(f"  OK   jobs={len(jobs)}  time={site_time:.1f}s")
+                processed_this_run += 1
+                if processed_this_run % SAVE_EVERY == 0:
+                    log(f"  Checkpoint saved (jobs={total_jobs_count})")
+                    jobs_sink.flush()
+                    save_progress({
+                        "completed": list(completed),
+                        "failed": failed,
+                    })
 
-                for job in jobs:
-                    all_jobs.append(job.to_dict())
+            site_num = len(completed)
+            progress_pct = (site_num / total_sites) * 100 if total_sites else 0
+            log(f"[{site_num}/{total_sites} | {progress_pct:5.1f}%] batch done")
 
-                completed.add(site_url)
+            # Persist the cursor at the end of every batch.
+            jobs_sink.flush()
+            save_progress({
+                "completed": list(completed),
+                "failed": failed,
+            })
+            log(f"Batch checkpoint saved ({PROGRESS_FILE}, {JOBS_SINK})")
 
-            except Exception as e:
-                site_time = time.time() - site_start
-                error_msg = str(e)[:50]
-                log(f"  FAIL error={error_msg}  time={site_time:.1f}s")
-                failed.append({"site": site_url, "error": str(e)})
-                completed.add(site_url)
+    parse_pool.shutdown()
+    await close_shared_session()
 
-            processed_this_run += 1
-            if processed_this_run % SAVE_EVERY == 0:
-                log(f"  Checkpoint saved (jobs={len(all_jobs)})")
-                save_progress({
-                    "completed": list(completed),
-                    "jobs": all_jobs,
-                    "failed": failed,
-                })
-
-        remaining_after_batch = len([s for s in sites if s not in completed])
-        elapsed_batch_run = time.time() - start_time
-        batch_stats = {
-            "total_sites": total_sites,
-            "sites_completed": len(completed),
-            "sites_remaining": remaining_after_batch,
-            "total_jobs": len(all_jobs),
-            "time_seconds": round(elapsed_batch_run, 1),
-            "date": datetime.now().isoformat(),
-        }
-
-        # Persist both files at the end of every batch.
-        save_progress({
-            "completed": list(completed),
-            "jobs": [],
-            "failed": failed,
-        })
-        save_jobs(all_jobs, batch_stats)
-        log(f"Batch checkpoint saved ({PROGRESS_FILE}, {OUTPUT_FILE})")
-    
     total_time = time.time() - start_time
-    remaining = len([s for s in sites if s not in completed])
-    
+    remaining = len(pending)
+
     log("")
     log_section("BATCH DONE")
     log(f"Batch sites: {last_batch_size}")
-    log(f"Total jobs: {len(all_jobs)}")
+    log(f"Total jobs: {total_jobs_count}")
     log(f"Remaining sites: {remaining}")
     log(f"Elapsed: {total_time:.0f}s ({total_time/60:.1f} min)")
-    
-    stats = {
-        "total_sites": total_sites,
-        "sites_completed": len(completed),
-        "sites_remaining": remaining,
-        "total_jobs": len(all_jobs),
-        "time_seconds": round(total_time, 1),
-        "date": datetime.now().isoformat(),
-    }
-    
+
     save_progress({
         "completed": list(completed),
-        "jobs": [],
         "failed": failed,
     })
-    
-    save_jobs(all_jobs, stats)
-    log(f"\nSaved: {OUTPUT_FILE}")
-    
+    log(f"\nSaved: {JOBS_SINK}")
+
     if remaining == 0:
         log("\nAll pending sites processed in this run")
         if Path(FINALIZE_SCRIPT).exists():
-            log(f"Running global dedup: {FINALIZE_SCRIPT}")
+            log(f"Running final stats: {FINALIZE_SCRIPT}")
             try:
                 subprocess.run([sys.executable, FINALIZE_SCRIPT], check=True)
-                log("Global dedup completed")
+                log("Final stats completed")
             except Exception as e:
-                log(f"Global dedup failed: {e}")
+                log(f"Final stats failed: {e}")
         else:
             log(f"Finalize script not found: {FINALIZE_SCRIPT}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
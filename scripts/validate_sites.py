@@ -1,19 +1,23 @@
 #!/usr/bin/env python
 """Validate Avature sites and optionally add from crt.sh."""
 
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 from pathlib import Path
-from tqdm import tqdm
+
+import requests
+from curl_cffi import requests as curl_requests
+
+CONCURRENCY = 200
+VALIDATE_READ_BYTES = 8192
 
 
 def get_subdomains_from_crt() -> set[str]:
     """Get extra subdomains from Certificate Transparency logs."""
     url = "https://crt.sh/?q=%.avature.net&output=json"
     subdomains = set()
-    
+
     print("Fetching subdomains from crt.sh...")
-    
+
     try:
         response = requests.get(url, timeout=60)
         if response.status_code == 200:
@@ -28,40 +32,68 @@ def get_subdomains_from_crt() -> set[str]:
             print(f"  Found {len(subdomains)} subdomains from crt.sh")
     except Exception as e:
         print(f"  Error fetching crt.sh: {e}")
-    
+
     return subdomains
 
 
-def validate_site(url: str) -> tuple[str, bool, int]:
+async def validate_site(
+    session: curl_requests.AsyncSession,
+    url: str,
+    semaphore: asyncio.Semaphore,
+) -> tuple[str, bool, int]:
     """Check if a site is active and valid."""
-    try:
-        response = requests.get(url, timeout=10, allow_redirects=True)
-        is_valid = response.status_code == 200 and "avature" in response.text.lower()
-        return (url, is_valid, response.status_code)
-    except:
-        return (url, False, 0)
+    async with semaphore:
+        # Cheap HEAD first to weed out dead hosts without pulling a body.
+        try:
+            response = await session.head(url, timeout=10, allow_redirects=True)
+            status = response.status_code
+        except Exception:
+            return (url, False, 0)
+
+        if status != 200 and status != 405:
+            return (url, False, status)
 
+        # Confirm the "avature" marker reading only the first 8KB.
+        try:
+            response = await session.get(
+                url, timeout=10, allow_redirects=True, stream=True
+            )
+            head = b""
+            async for chunk in response.aiter_content():
+                head += chunk
+                if len(head) >= VALIDATE_READ_BYTES:
+                    break
+            await response.aclose()
+            is_valid = response.status_code == 200 and b"avature" in head.lower()
+            return (url, is_valid, response.status_code)
+        except Exception:
+            return (url, False, 0)
 
-def validate_all(urls: list[str], workers: int = 30) -> list[str]:
-    """Validate many sites in parallel."""
+
+async def validate_all(urls: list[str], concurrency: int = CONCURRENCY) -> list[str]:
+    """Validate many sites concurrently."""
     valid = []
     failed = []
-    
-    print(f"\nValidating {len(urls)} sites with {workers} workers...")
-    
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(validate_site, url): url for url in urls}
-        
-        for future in tqdm(as_completed(futures), total=len(urls), desc="Validating"):
-            url, is_valid, status = future.result()
+
+    print(f"\nValidating {len(urls)} sites with concurrency {concurrency}...")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    async with curl_requests.AsyncSession() as session:
+        tasks = [validate_site(session, url, semaphore) for url in urls]
+        done = 0
+        for future in asyncio.as_completed(tasks):
+            url, is_valid, status = await future
             if is_valid:
                 valid.append(url)
             else:
                 failed.append((url, status))
-    
+            done += 1
+            if done % 100 == 0 or done == len(urls):
+                print(f"  Validated {done}/{len(urls)} ({len(valid)} valid)")
+
     print(f"\n  Valid sites: {len(valid)}")
     print(f"  Failed sites: {len(failed)}")
-    
+
     return sorted(valid)
 
 
@@ -81,30 +113,30 @@ def main():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     sites_file = project_root / "input" / "avature_sites.txt"
-    
+
     existing_sites = load_sites(str(sites_file))
     print(f"Loaded {len(existing_sites)} sites from file")
-    
+
     existing_subdomains = set()
     for url in existing_sites:
         sub = url.split("//")[1].split(".")[0]
         existing_subdomains.add(sub)
-    
+
     crt_subdomains = get_subdomains_from_crt()
     new_subdomains = crt_subdomains - existing_subdomains
-    
+
     if new_subdomains:
         print(f"  New subdomains from crt.sh: {len(new_subdomains)}")
         for sub in new_subdomains:
             existing_sites.append(f"https://{sub}.avature.net/careers")
         existing_sites = sorted(set(existing_sites))
         print(f"  Total sites to validate: {len(existing_sites)}")
-    
-    valid_sites = validate_all(existing_sites)
-    
+
+    valid_sites = asyncio.run(validate_all(existing_sites))
+
     save_sites(str(sites_file), valid_sites)
     print(f"\nSaved {len(valid_sites)} valid sites to {sites_file}")
-    
+
     print("\nExamples of valid sites:")
     for url in valid_sites[:10]:
         print(f"  - {url}")
@@ -4,6 +4,14 @@ Avature API endpoints and URL patterns.
 Discovered by analyzing: ally.avature.net, broadinstitute.avature.net, astellas.avature.net
 """
 
+import re
+from functools import lru_cache
+
+
+# Matches either a jobId query param or a trailing all-digit path segment
+# (JobDetail/{slug}/{id}); compiled once, called once per job.
+_JOB_ID_RE = re.compile(r'jobId=(\d+)|/(\d+)(?:[/?#]|$)')
+
 
 # Base URL patterns
 # Some sites have locale prefix: /{locale}/careers (e.g., /en_US/, /en_GB/)
@@ -70,6 +78,18 @@ SELECTORS = {
 #   - Total: 133 jobs
 
 
+@lru_cache(maxsize=4096)
+def _search_prefix(base_url: str, endpoint: str) -> str:
+    """Normalized listing prefix; cached since pagination repeats it per page."""
+    return f"{base_url.rstrip('/')}/{endpoint.strip('/')}/"
+
+
+@lru_cache(maxsize=4096)
+def _detail_prefix(base_url: str) -> str:
+    """Normalized job detail prefix; cached per site."""
+    return f"{base_url.rstrip('/')}/JobDetail"
+
+
 def build_search_url(
     base_url: str,
     offset: int = 0,
@@ -77,27 +97,38 @@ def build_search_url(
     endpoint: str = "SearchJobs",
 ) -> str:
     """Build URL to fetch job listings."""
-    base = base_url.rstrip("/")
-    endpoint_clean = endpoint.strip("/")
-    return f"{base}/{endpoint_clean}/?jobRecordsPerPage={per_page}&jobOffset={offset}"
+    return f"{_search_prefix(base_url, endpoint)}?jobRecordsPerPage={per_page}&jobOffset={offset}"
+
+
+def make_search_url_builder(
+    base_url: str,
+    per_page: int = 50,
+    endpoint: str = "SearchJobs",
+):
+    """Return an offset -> URL closure with everything else pre-rendered.
+
+    Pagination only ever varies the offset, so the prefix is built once
+    and each page URL is a single concatenation.
+    """
+    prefix = f"{_search_prefix(base_url, endpoint)}?jobRecordsPerPage={per_page}&jobOffset="
+
+    def make_url(offset: int) -> str:
+        return f"{prefix}{offset}"
+
+    return make_url
 
 
 def build_job_url(base_url: str, job_id: str, slug: str = "") -> str:
     """Build URL for job detail page."""
-    base = base_url.rstrip("/")
+    base = _detail_prefix(base_url)
     if slug:
-        return f"{base}/JobDetail/{slug}/{job_id}"
-    return f"{base}/JobDetail?jobId={job_id}"
+        return f"{base}/{slug}/{job_id}"
+    return f"{base}?jobId={job_id}"
 
 
 def extract_job_id_from_url(url: str) -> str:
     """Extract job ID from a job detail URL."""
-    if "jobId=" in url:
-        return url.split("jobId=")[1].split("&")[0]
-    
-    parts = url.rstrip("/").split("/")
-    for part in reversed(parts):
-        if part.isdigit():
-            return part
-    
+    match = _JOB_ID_RE.search(url)
+    if match:
+        return match.group(1) or match.group(2)
     return ""
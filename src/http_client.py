@@ -1,81 +1,166 @@
-"""HTTP client with retry, rate limiting, and proxy support."""
+"""Async HTTP client with retry, rate limiting, and proxy support."""
 
-import random
+import asyncio
 import time
 from curl_cffi import requests
 
 from .proxy_manager import ProxyManager
 
 
+# Process-wide session: one connection pool and one Chrome-impersonation
+# setup shared by every client, so warm TLS connections carry across sites.
+_shared_session: requests.AsyncSession | None = None
+
+
+def get_shared_session() -> requests.AsyncSession:
+    """Lazily create the shared impersonated session.
+
+    max_clients is sized for concurrent sites x concurrent pages so
+    in-flight requests aren't queued behind the small default pool;
+    connections are kept alive and reused across probes and pages of
+    the same host.
+    """
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = requests.AsyncSession(
+            impersonate="chrome", max_clients=64
+        )
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared session at process shutdown."""
+    global _shared_session
+    if _shared_session is not None:
+        await _shared_session.close()
+        _shared_session = None
+
+
+class AdaptiveRateLimiter:
+    """AIMD request pacing driven by server responses.
+
+    Starts optimistic and speeds up additively while the server keeps
+    answering, then halves the rate on 429/503/timeouts. Replaces a
+    fixed pre-request sleep: sites that don't throttle aren't slowed
+    down, sites that do get backed off harder than a constant delay
+    ever would.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 10.0,
+        max_rate: float = 20.0,
+        min_rate: float = 0.5
+    ):
+        self.rate = initial_rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot at the current rate."""
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + 1.0 / self.rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def on_success(self) -> None:
+        """Additive increase after a successful response."""
+        self.rate = min(self.rate + 0.5, self.max_rate)
+
+    def on_backoff(self, retry_after: str | None = None) -> None:
+        """Multiplicative decrease after throttling or failure."""
+        self.rate = max(self.rate * 0.5, self.min_rate)
+        if retry_after:
+            try:
+                self._next_slot = time.monotonic() + float(retry_after)
+            except ValueError:
+                pass
+
+
 class HTTPClient:
-    """HTTP client that impersonates a browser with optional proxy rotation."""
-    
+    """Async HTTP client that impersonates a browser with optional proxy rotation."""
+
     def __init__(
         self,
         max_retries: int = 3,
         base_delay: float = 1.0,
-        proxy_manager: ProxyManager = None
+        proxy_manager: ProxyManager = None,
+        session: requests.AsyncSession = None
     ):
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.proxy_manager = proxy_manager
-        self.session = requests.Session(impersonate="chrome")
-    
-    def get(self, url: str, **kwargs) -> requests.Response:
+        # Defaults to the process-wide shared session; an explicit session
+        # is owned by whoever created it.
+        self.session = session or get_shared_session()
+        # Each scraper talks to one host, so a per-client limiter is a
+        # per-host limiter.
+        self.limiter = AdaptiveRateLimiter()
+
+    async def get(self, url: str, **kwargs) -> requests.Response:
         """Make GET request with retry, rate limiting, and proxy rotation."""
         last_error = None
-        
+
         for attempt in range(self.max_retries):
             proxy = self._get_proxy()
-            
+            throttled = False
+
             try:
-                self._polite_delay()
-                response = self.session.get(
+                await self.limiter.acquire()
+                response = await self.session.get(
                     url,
                     timeout=15,
                     proxies=proxy,
                     **kwargs
                 )
+
+                if response.status_code in (429, 503):
+                    throttled = True
+                    self.limiter.on_backoff(response.headers.get("Retry-After"))
                 response.raise_for_status()
-                
+                self.limiter.on_success()
+
                 if proxy and self.proxy_manager:
                     self.proxy_manager.mark_good(proxy.get("http", ""))
-                
+
                 return response
-                
+
             except Exception as e:
                 last_error = e
-                
+
+                if not throttled:
+                    self.limiter.on_backoff()
+
                 if proxy and self.proxy_manager:
                     self.proxy_manager.mark_bad(proxy.get("http", ""))
-                
+
                 if attempt < self.max_retries - 1:
                     wait_time = self.base_delay * (2 ** attempt)
-                    time.sleep(wait_time)
-        
+                    await asyncio.sleep(wait_time)
+
         raise last_error
-    
+
     def _get_proxy(self) -> dict | None:
         """Get proxy dict for requests."""
         if not self.proxy_manager:
             return None
-        
+
         proxy_url = self.proxy_manager.get_next()
         if not proxy_url:
             return None
-        
+
         return {"http": proxy_url, "https": proxy_url}
-    
-    def _polite_delay(self) -> None:
-        """Random delay to be nice to servers."""
-        time.sleep(random.uniform(0.3, 0.8))
-    
-    def close(self) -> None:
-        """Close the session."""
-        self.session.close()
-    
-    def __enter__(self):
+
+    async def close(self) -> None:
+        """No-op: the session is shared and lives for the process.
+
+        Shut the pool down with close_shared_session() when the run ends.
+        """
+
+    async def __aenter__(self):
         return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
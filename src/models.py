@@ -1,29 +1,43 @@
 """Data models for job scraping."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from pydantic import BaseModel, Field
 
 
-class Job(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Job:
     """Represents a job posting from Avature."""
-    
+
     job_id: str
     title: str
     company: str
+    application_url: str
     location: str = "Unknown"
     description: str = ""
-    application_url: str
     date_posted: str | None = None
     category: str | None = None
     employment_type: str | None = None
     source_url: str = ""
-    scraped_at: str = Field(default_factory=lambda: datetime.now().isoformat())
-    
+    scraped_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
     def to_dict(self) -> dict:
         """Convert job to dictionary."""
-        return self.model_dump()
-    
+        # Unrolled by hand: faster than dataclasses.asdict, which recurses.
+        return {
+            "job_id": self.job_id,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "description": self.description,
+            "application_url": self.application_url,
+            "date_posted": self.date_posted,
+            "category": self.category,
+            "employment_type": self.employment_type,
+            "source_url": self.source_url,
+            "scraped_at": self.scraped_at,
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> "Job":
         """Create job from dictionary."""
-        return cls.model_validate(data)
+        return cls(**data)
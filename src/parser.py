@@ -1,63 +1,110 @@
 """HTML parser for Avature job listings."""
 
 import re
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from .models import Job
 from .endpoints import extract_job_id_from_url
 
 
-def parse_job_listing(html: str, company: str, base_url: str) -> list[Job]:
+# Compiled once at import; these run on every page/card parsed.
+_DATE_RE = re.compile(r'Posted\s+([A-Za-z]+-\d{1,2}-\d{4})')
+_WS_RE = re.compile(r'\s+')
+# Prefers the "of N" total when present ("1 - 50 of 133 results"),
+# otherwise the bare count ("133 results").
+_TOTAL_RE = re.compile(r'(?:of\s+)?(\d+)\s*results?', re.IGNORECASE)
+_TITLE_XP = etree.XPath('.//h3//a')
+_INFO_XP = etree.XPath('.//div[contains(., "Posted") and contains(., "Ref")]')
+_APPLY_XP = etree.XPath('.//a[contains(@href, "ApplicationMethods")]')
+_CHILD_DIVS_XP = etree.XPath('./div')
+
+
+def _text(element) -> str:
+    """Whitespace-normalized text content of an element."""
+    return clean_text("".join(element.itertext()))
+
+
+def parse_job_listing(
+    html: str,
+    job_factory,
+    base_url: str,
+    profile: dict = None,
+) -> list[Job]:
     """
     Parse HTML page and extract job cards.
-    
+
     Args:
         html: Raw HTML from job listing page
-        company: Company name for the jobs
+        job_factory: Job constructor with per-site invariants (company)
+            already bound, e.g. functools.partial(Job, company=...)
         base_url: Base URL of the career site
-    
+        profile: Optional per-site layout profile, updated in place.
+            Avature sites keep one card layout across all their pages,
+            so facts discovered on the first cards (which child div
+            holds the description) let later cards skip the discovery
+            scans; a stale hint is re-verified before use and falls
+            back to the full scan.
+
     Returns:
         List of Job objects
     """
-    soup = BeautifulSoup(html, "lxml")
+    try:
+        tree = lxml_html.fromstring(html)
+    except etree.ParserError:
+        return []
     jobs = []
-    
-    articles = soup.find_all("article")
-    
-    for article in articles:
-        job = parse_job_card(article, company, base_url)
+
+    for article in tree.iter("article"):
+        job = parse_job_card(article, job_factory, base_url, profile)
         if job:
             jobs.append(job)
-    
+
     return jobs
 
 
-def parse_job_card(article, company: str, base_url: str) -> Job | None:
+def parse_job_listing_profiled(
+    html: str,
+    job_factory,
+    base_url: str,
+    profile: dict,
+) -> tuple[list[Job], dict]:
+    """Executor-friendly wrapper returning the updated profile with the jobs.
+
+    In-place profile mutations don't cross a process boundary, so callers
+    pass a snapshot of their profile and merge the returned one back
+    themselves.
+    """
+    jobs = parse_job_listing(html, job_factory, base_url, profile)
+    return jobs, profile
+
+
+def parse_job_card(article, job_factory, base_url: str, profile: dict = None) -> Job | None:
     """Parse a single job card article element."""
     try:
-        title_link = article.select_one("h3 a")
-        if not title_link:
+        title_links = _TITLE_XP(article)
+        if not title_links:
             return None
-        
-        title = title_link.get_text(strip=True)
+        title_link = title_links[0]
+
+        title = _text(title_link)
         job_url = title_link.get("href", "")
-        
+
         if not job_url.startswith("http"):
             job_url = base_url.rstrip("/") + job_url
-        
+
         job_id = extract_job_id_from_url(job_url)
         if not job_id:
             return None
-        
+
         location, date_posted = parse_job_info(article, title)
-        
-        description = parse_description(article)
-        
+
+        description = parse_description(article, profile)
+
         application_url = parse_apply_url(article, base_url, job_id)
-        
-        return Job(
+
+        return job_factory(
             job_id=job_id,
             title=title,
-            company=company,
             location=location,
             description=description,
             application_url=application_url,
@@ -72,16 +119,16 @@ def parse_job_info(article, title: str) -> tuple[str, str]:
     """Extract location and date from job info text."""
     location = "Unknown"
     date_posted = None
-    
-    info_divs = article.find_all("div")
-    for div in info_divs:
-        text = div.get_text(strip=True)
-        if "Posted" in text and "Ref" in text:
-            if title and text.startswith(title):
-                text = text[len(title):]
-            location, date_posted = extract_location_and_date(text)
-            break
-    
+
+    # Compiled XPath instead of collecting every descendant div; matches
+    # the same first-in-document-order div the old scan found.
+    info_divs = _INFO_XP(article)
+    if info_divs:
+        text = _text(info_divs[0])
+        if title and text.startswith(title):
+            text = text[len(title):]
+        location, date_posted = extract_location_and_date(text)
+
     return location, date_posted
 
 
@@ -89,11 +136,11 @@ def extract_location_and_date(text: str) -> tuple[str, str]:
     """Parse info text like 'Charlotte , NC , USA , Ref #21505 . Posted Jan-30-2026'."""
     location = "Unknown"
     date_posted = None
-    
-    date_match = re.search(r'Posted\s+([A-Za-z]+-\d{1,2}-\d{4})', text)
+
+    date_match = _DATE_RE.search(text)
     if date_match:
         date_posted = date_match.group(1)
-    
+
     parts = text.split(",")
     if len(parts) >= 2:
         location_parts = []
@@ -104,49 +151,58 @@ def extract_location_and_date(text: str) -> tuple[str, str]:
             location_parts.append(part)
         if location_parts:
             location = ", ".join(location_parts)
-            location = re.sub(r'\s+', ' ', location).strip()
+            location = _WS_RE.sub(' ', location).strip()
             location = location.rstrip(" ,.")
-    
+
     return location, date_posted
 
 
-def parse_description(article) -> str:
+def parse_description(article, profile: dict = None) -> str:
     """Extract description preview from job card."""
-    all_divs = article.find_all("div", recursive=False)
-    
-    for div in reversed(all_divs):
-        text = div.get_text(strip=True)
+    all_divs = _CHILD_DIVS_XP(article)
+
+    # Try the child position learned from earlier cards before scanning.
+    if profile is not None:
+        idx = profile.get("description_index")
+        if idx is not None and -len(all_divs) <= idx < 0:
+            text = _text(all_divs[idx])
+            if len(text) > 50 and "Posted" not in text and "Apply" not in text:
+                return text
+
+    for i, div in zip(range(-1, -len(all_divs) - 1, -1), reversed(all_divs)):
+        text = _text(div)
         if len(text) > 50 and "Posted" not in text and "Apply" not in text:
-            return clean_text(text)
-    
+            if profile is not None:
+                profile["description_index"] = i
+            return text
+
     return ""
 
 
 def parse_apply_url(article, base_url: str, job_id: str) -> str:
     """Extract or build the apply URL."""
-    apply_link = article.select_one('a[href*="ApplicationMethods"]')
-    if apply_link:
-        url = apply_link.get("href", "")
+    # Apply-link presence varies card by card (not a site-wide layout
+    # fact), so always run the compiled lookup and only synthesize the
+    # standard pattern when this card really has no anchor.
+    apply_links = _APPLY_XP(article)
+    if apply_links:
+        url = apply_links[0].get("href", "")
         if not url.startswith("http"):
             return base_url.rstrip("/") + url
         return url
-    
+
     return f"{base_url.rstrip('/')}/careers/ApplicationMethods?jobId={job_id}"
 
 
 def parse_total_jobs(html: str) -> int:
-    """Extract total job count from page."""
-    soup = BeautifulSoup(html, "lxml")
-    
-    result_text = soup.find(string=re.compile(r'\d+\s*results?'))
-    if result_text:
-        match = re.search(r'of\s+(\d+)', result_text)
-        if match:
-            return int(match.group(1))
-        match = re.search(r'(\d+)\s*results?', result_text)
-        if match:
-            return int(match.group(1))
-    
+    """Extract total job count from page.
+
+    Runs one regex over the raw HTML rather than building a full tree
+    just to locate a single text node.
+    """
+    match = _TOTAL_RE.search(html)
+    if match:
+        return int(match.group(1))
     return 0
 
 
@@ -154,5 +210,5 @@ def clean_text(text: str) -> str:
     """Clean and normalize text."""
     if not text:
         return ""
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     return text.strip()
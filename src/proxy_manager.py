@@ -1,5 +1,6 @@
 """Simple proxy rotation manager."""
 
+import itertools
 import threading
 from pathlib import Path
 
@@ -16,8 +17,11 @@ class ProxyManager:
                       If None, no proxies are used.
         """
         self._proxies = []
-        self._bad_proxies = set()
-        self._index = 0
+        # Readers never lock: the counter increment is atomic under the
+        # GIL and the bad set is an immutable frozenset swapped by
+        # writers while holding the lock.
+        self._bad_proxies = frozenset()
+        self._counter = itertools.count()
         self._lock = threading.Lock()
         
         if filepath:
@@ -61,34 +65,31 @@ class ProxyManager:
         """
         if not self._proxies:
             return None
-        
-        with self._lock:
-            attempts = 0
-            while attempts < len(self._proxies):
-                proxy = self._proxies[self._index]
-                self._index = (self._index + 1) % len(self._proxies)
-                
-                if proxy not in self._bad_proxies:
-                    return proxy
-                
-                attempts += 1
-        
+
+        bad = self._bad_proxies
+        for _ in range(len(self._proxies)):
+            proxy = self._proxies[next(self._counter) % len(self._proxies)]
+            if proxy not in bad:
+                return proxy
+
         return None
     
     def mark_bad(self, proxy: str) -> None:
         """Mark a proxy as failed."""
         with self._lock:
-            self._bad_proxies.add(proxy)
-    
+            if proxy not in self._bad_proxies:
+                self._bad_proxies = self._bad_proxies | {proxy}
+
     def mark_good(self, proxy: str) -> None:
         """Mark a proxy as working again."""
         with self._lock:
-            self._bad_proxies.discard(proxy)
-    
+            if proxy in self._bad_proxies:
+                self._bad_proxies = self._bad_proxies - {proxy}
+
     def reset_bad(self) -> None:
         """Clear all bad proxy marks."""
         with self._lock:
-            self._bad_proxies.clear()
+            self._bad_proxies = frozenset()
     
     @property
     def total(self) -> int: